@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""Build the phi_aot extension module used by python_performance_fix_safe.py
+
+Compiles the phi score kernel ahead of time with Numba's pycc, so the
+performance runner imports plain machine code instead of paying JIT
+compilation or cache loading on start-up. Requires Numba; run it once:
+
+    python build_phi_aot.py
+"""
+
+from pathlib import Path
+
+from numba.pycc import CC
+
+from python_performance_fix_safe import _phi_score_py
+
+cc = CC("phi_aot")
+cc.output_dir = str(Path(__file__).resolve().parent)
+
+# Same kernel as the JIT and pure-Python paths: (value, six ratios) -> score
+cc.export("phi_score", "f8(f8, UniTuple(f8, 6))")(_phi_score_py)
+
+if __name__ == "__main__":
+    cc.compile()
+    print(f"Built phi_aot in {cc.output_dir}")
@@ -1,60 +1,73 @@
 #!/usr/bin/env python3
 """Bulk fix script for common Pylance issues."""
 
+import ast
 import os
 import re
-
-
-def fix_logging_format(content: str) -> str:
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Precompiled patterns shared by the fixers below. Files are handled as raw
+# bytes: every pattern is ASCII, so no UTF-8 decode/encode round trip is needed.
+_LOGGER_FSTRING = re.compile(
+    rb"logger\.(?P<level>\w+)\(f(?:\"(?P<dq>[^\"]*?)\"|'(?P<sq>[^']*?)')\)"
+)
+_VAR_RE = re.compile(rb"\{([^}]+)\}")
+
+# The indent group only takes spaces/tabs so it cannot compete with the
+# preceding \s* over newlines, which backtracked quadratically on long runs
+# of blank lines.
+_EXC_RE = re.compile(
+    rb"except (?:(?P<broad>Exception as e)|FileNotFoundError):\s*\n"
+    rb"(?P<indent>[ \t]+)(?P<stmt>[^\n]*raise [^\n]*Error[^\n]*)\n",
+    re.MULTILINE,
+)
+
+_OPEN_RE = re.compile(rb'open\((?P<arg>[^,)]+)(?:,\s*"(?P<mode>[rwa]+)")?\)')
+
+
+def _lazy_log(match: re.Match[bytes]) -> bytes:
+    """Rewrite one f-string logging call to lazy % formatting."""
+    log_level = match.group("level")
+    message = match.group("dq")
+    if message is None:
+        message = match.group("sq")
+
+    # Extract variables from {var} patterns
+    variables = _VAR_RE.findall(message)
+    if not variables:
+        return match.group(0)
+
+    # Replace {var} with %s
+    new_message = _VAR_RE.sub(b"%s", message)
+    var_list = b", ".join(variables)
+    return b'logger.%s("%s", %s)' % (log_level, new_message, var_list)
+
+
+def fix_logging_format(content: bytes) -> bytes:
     """Fix f-string logging to use lazy % formatting."""
-    # Pattern to match logger.info(f"...{var}...") and similar
-    patterns = [
-        (r'logger\.(\w+)\(f"([^"]*?)"\)', r'logger.\1("\2")'),
-        (r"logger\.(\w+)\(f\'([^\']*?)\'\)", r'logger.\1("\2")'),
-    ]
-
-    for pattern, _replacement in patterns:
-        # Find all f-string logging calls
-        matches = re.finditer(pattern, content)
-        for match in reversed(list(matches)):
-            log_level = match.group(1)
-            message = match.group(2)
-
-            # Extract variables from {var} patterns
-            var_pattern = r"\{([^}]+)\}"
-            variables = re.findall(var_pattern, message)
-
-            if variables:
-                # Replace {var} with %s
-                new_message = re.sub(var_pattern, "%s", message)
-                # Build the replacement
-                var_list = ", ".join(variables)
-                new_call = f'logger.{log_level}("{new_message}", {var_list})'
+    # Match logger.info(f"...{var}...") and similar, for both quote styles
+    return _LOGGER_FSTRING.sub(_lazy_log, content)
 
-                # Replace in content
-                start, end = match.span()
-                content = content[:start] + new_call + content[end:]
 
-    return content
+def _chain_exception(match: re.Match[bytes]) -> bytes:
+    """Append the matching 'from' clause to a re-raise inside an except block."""
+    if match.group("broad"):
+        handler, name = b"except Exception as e:", b"e"
+    else:
+        handler, name = b"except FileNotFoundError as exc:", b"exc"
+    return b"%s\n%s%s from %s\n" % (
+        handler,
+        match.group("indent"),
+        match.group("stmt"),
+        name,
+    )
 
 
-def fix_exception_handling(content: str) -> str:
+def fix_exception_handling(content: bytes) -> bytes:
     """Fix exception handling to use 'from e' pattern."""
-    patterns = [
-        (
-            r"except Exception as e:\s*\n(\s+)([^\n]*raise [^\n]*Error[^\n]*)\n",
-            r"except Exception as e:\n\1\2 from e\n",
-        ),
-        (
-            r"except FileNotFoundError:\s*\n(\s+)([^\n]*raise [^\n]*Error[^\n]*)\n",
-            r"except FileNotFoundError as exc:\n\1\2 from exc\n",
-        ),
-    ]
-
-    for pattern, replacement in patterns:
-        content = re.sub(pattern, replacement, content, flags=re.MULTILINE)
-
-    return content
+    return _EXC_RE.sub(_chain_exception, content)
 
 
 def fix_unused_variables(content: str) -> str:
@@ -69,59 +82,66 @@ def fix_unused_variables(content: str) -> str:
     return content
 
 
-def fix_import_paths(content: str, file_path: str) -> str:
+def fix_import_paths(content: bytes, file_path: str) -> bytes:
     """Fix import paths to use proper relative imports."""
     if "test_" in file_path or file_path.endswith("_test.py"):
         # Add sys.path fix for test files
-        if "import sys" not in content and "from core." in content:
-            import_section = 'import sys\nsys.path.insert(0, os.path.join(os.path.dirname(__file__), "blackbox-task-manager", "src"))\n\n'
-
-            # Find the first import line
-            lines = content.split("\n")
-            insert_pos = 0
-            for i, line in enumerate(lines):
-                if line.startswith("import ") or line.startswith("from "):
-                    insert_pos = i
+        if b"import sys" not in content and b"from core." in content:
+            import_section = b'import sys\nsys.path.insert(0, os.path.join(os.path.dirname(__file__), "blackbox-task-manager", "src"))\n\n\n'
+
+            # Find the first import line (not counting the very first line)
+            offset = 0
+            for i, line in enumerate(content.split(b"\n")):
+                if line.startswith((b"import ", b"from ")):
+                    if i > 0:
+                        content = content[:offset] + import_section + content[offset:]
                     break
-
-            if insert_pos > 0:
-                lines.insert(insert_pos, import_section)
-                content = "\n".join(lines)
+                offset += len(line) + 1
 
     return content
 
 
-def fix_file_encoding(content: str) -> str:
-    """Fix file operations to include encoding."""
-    patterns = [
-        (r"open\(([^,)]+)\)", r'open(\1, encoding="utf-8")'),
-        (r'open\(([^,)]+),\s*"([rwa]+)"\)', r'open(\1, "\2", encoding="utf-8")'),
-    ]
+def _add_encoding(match: re.Match[bytes]) -> bytes:
+    """Add an explicit UTF-8 encoding to one open() call."""
+    mode = match.group("mode")
+    if mode:
+        return b'open(%s, "%s", encoding="utf-8")' % (match.group("arg"), mode)
+    return b'open(%s, encoding="utf-8")' % match.group("arg")
 
-    for pattern, replacement in patterns:
-        content = re.sub(pattern, replacement, content)
 
-    return content
+def fix_file_encoding(content: bytes) -> bytes:
+    """Fix file operations to include encoding."""
+    return _OPEN_RE.sub(_add_encoding, content)
 
 
 def process_file(file_path: str) -> bool:
     """Process a single file and apply fixes."""
     try:
-        with open(file_path, encoding="utf-8") as f:
-            original_content = f.read()
+        original_content = Path(file_path).read_bytes()
 
+        # Each fixer runs over the previous one's output so their rewrites
+        # compose (an open() inside a rewritten raise or logger call still
+        # gains its encoding); fixers whose trigger text never appears are
+        # skipped
         content = original_content
-
-        # Apply fixes
-        content = fix_logging_format(content)
-        content = fix_exception_handling(content)
+        if b"logger." in content:
+            content = fix_logging_format(content)
+        if b"except " in content:
+            content = fix_exception_handling(content)
         content = fix_import_paths(content, file_path)
-        content = fix_file_encoding(content)
+        if b"open(" in content:
+            content = fix_file_encoding(content)
 
         # Only write if content changed
         if content != original_content:
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(content)
+            # The fixers are line-oriented regexes; parse the result once so a
+            # bad rewrite (e.g. inside a multiline string) never reaches disk.
+            try:
+                ast.parse(content, filename=file_path)
+            except SyntaxError as e:
+                print(f"Skipped (rewrite is not valid Python): {file_path}: {e}")
+                return False
+            Path(file_path).write_bytes(content)
             print(f"Fixed: {file_path}")
             return True
         else:
@@ -133,6 +153,23 @@ def process_file(file_path: str) -> bool:
         return False
 
 
+def find_existing_files(file_paths: list[str]) -> set[str]:
+    """Return the paths that exist, scanning each parent directory once."""
+    by_dir: defaultdict[str, list[str]] = defaultdict(list)
+    for file_path in file_paths:
+        by_dir[os.path.dirname(file_path)].append(file_path)
+
+    existing = set()
+    for directory, paths in by_dir.items():
+        try:
+            with os.scandir(directory or ".") as entries:
+                present = {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            continue
+        existing.update(p for p in paths if os.path.basename(p) in present)
+    return existing
+
+
 def main():
     """Main function to process all Python files."""
     # Add specific files that need fixing
@@ -153,15 +190,21 @@ def main():
 
     print(f"Starting bulk fixes for {len(target_files)} files...")
 
-    fixed_count = 0
+    present = find_existing_files(target_files)
+    existing_files = []
     for file_path in target_files:
         print(f"Checking: {file_path}")
-        if os.path.exists(file_path):
-            print("  File exists, processing...")
-            if process_file(file_path):
-                fixed_count += 1
+        if file_path in present:
+            existing_files.append(file_path)
         else:
             print(f"  File not found: {file_path}")
+
+    # File I/O dominates, so overlap it across a small thread pool
+    fixed_count = 0
+    if existing_files:
+        print(f"Processing {len(existing_files)} existing files...")
+        with ThreadPoolExecutor(max_workers=min(8, len(existing_files))) as executor:
+            fixed_count = sum(executor.map(process_file, existing_files))
     print(f"\nProcessed {len(target_files)} files, fixed {fixed_count} files")
 
 
@@ -3,6 +3,7 @@
 Debug version to identify hanging issues
 """
 
+import functools
 import logging
 import os
 import sys
@@ -15,6 +16,36 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# psutil readings shared by both tests. Each is collected once, on first use,
+# by its own helper, so a failure is reported against the component that
+# raised it
+
+
+@functools.cache
+def _cpu_percent():
+    """Sample CPU utilization once and reuse it"""
+    import psutil
+
+    return psutil.cpu_percent(interval=0.1)
+
+
+@functools.cache
+def _virtual_memory():
+    """Read memory statistics once and reuse them"""
+    import psutil
+
+    return psutil.virtual_memory()
+
+
+@functools.cache
+def _process_count():
+    """Count running processes once and reuse the count"""
+    import psutil
+
+    # Only the count is used, so stream the iterator without requesting
+    # per-process attributes
+    return sum(1 for _ in psutil.process_iter())
+
 
 def test_aar_components():
     """Test each AAR component separately"""
@@ -32,7 +63,7 @@ def test_aar_components():
     # Test 2: Basic system metrics
     try:
         logger.info("[TEST] Testing CPU metrics...")
-        cpu = psutil.cpu_percent(interval=0.1)
+        cpu = _cpu_percent()
         logger.info(f"[TEST] CPU: {cpu}%")
     except Exception as e:
         logger.error(f"[TEST] CPU metrics: FAILED - {e}")
@@ -41,7 +72,7 @@ def test_aar_components():
     # Test 3: Memory metrics
     try:
         logger.info("[TEST] Testing memory metrics...")
-        memory = psutil.virtual_memory()
+        memory = _virtual_memory()
         logger.info(f"[TEST] Memory: {memory.percent}%")
     except Exception as e:
         logger.error(f"[TEST] Memory metrics: FAILED - {e}")
@@ -65,8 +96,8 @@ def test_aar_components():
     # Test 5: Process enumeration
     try:
         logger.info("[TEST] Testing process enumeration...")
-        processes = list(psutil.process_iter(["pid", "name"]))
-        logger.info(f"[TEST] Found {len(processes)} processes")
+        process_count = _process_count()
+        logger.info(f"[TEST] Found {process_count} processes")
     except Exception as e:
         logger.error(f"[TEST] Process enumeration: FAILED - {e}")
         return False
@@ -90,13 +121,12 @@ def test_minimal_cycle():
     logger.info("[CYCLE] Starting minimal AAR cycle")
 
     try:
-        # Minimal metrics collection
-        import psutil
+        # Minimal metrics collection, reusing the component-test readings
         metrics = {
             'timestamp': datetime.now().isoformat(),
-            'cpu_percent': psutil.cpu_percent(interval=0.1),
-            'memory_percent': psutil.virtual_memory().percent,
-            'process_count': len(list(psutil.process_iter()))
+            'cpu_percent': _cpu_percent(),
+            'memory_percent': _virtual_memory().percent,
+            'process_count': _process_count()
         }
 
         logger.info(f"[CYCLE] Metrics collected: {metrics}")
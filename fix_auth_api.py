@@ -6,6 +6,11 @@ Addresses critical issues preventing API server startup for testing
 from pathlib import Path
 
 
+def _has_content(path, expected):
+    """Check whether a generated file already holds the expected text"""
+    return path.exists() and path.read_text(encoding="utf-8") == expected
+
+
 def fix_main_py():
     """Fix main.py to properly include authentication endpoints"""
     main_file = Path("tools/aar/api/main.py")
@@ -15,8 +20,8 @@ def fix_main_py():
         return False
 
     # Read current content
-    with open(main_file, encoding="utf-8") as f:
-        content = f.read()
+    content = main_file.read_text(encoding="utf-8")
+    original_content = content
 
     # Add router inclusion if not present
     if "from .endpoints import router" not in content:
@@ -46,9 +51,15 @@ def fix_main_py():
                     + content[middleware_end:]
                 )
 
-    # Write fixed content
-    with open(main_file, "w", encoding="utf-8") as f:
-        f.write(content)
+    # Only write if content changed
+    if content == original_content:
+        if "app.include_router(router)" in content:
+            print("✅ main.py router inclusion already in place")
+            return True
+        print("⚠️ main.py anchors not found; router inclusion not added")
+        return False
+
+    main_file.write_text(content, encoding="utf-8")
 
     print("✅ Fixed main.py router inclusion")
     return True
@@ -68,8 +79,11 @@ requests>=2.25.1
     req_file = Path("tools/aar/api/requirements.txt")
     req_file.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(req_file, "w", encoding="utf-8") as f:
-        f.write(requirements_content)
+    if _has_content(req_file, requirements_content):
+        print("✅ Minimal requirements.txt already up to date")
+        return True
+
+    req_file.write_text(requirements_content, encoding="utf-8")
 
     print("✅ Created minimal requirements.txt")
     return True
@@ -95,8 +109,11 @@ RATE_LIMIT_WINDOW=97
 """
 
     env_file = Path("tools/aar/api/.env")
-    with open(env_file, "w", encoding="utf-8") as f:
-        f.write(env_content)
+    if _has_content(env_file, env_content):
+        print("✅ .env configuration file already up to date")
+        return True
+
+    env_file.write_text(env_content, encoding="utf-8")
 
     print("✅ Created .env configuration file")
     return True
@@ -111,11 +128,14 @@ def fix_endpoints_import():
         return False
 
     # Read current content
-    with open(endpoints_file, encoding="utf-8") as f:
-        content = f.read()
-
-    # Fix relative import issue
-    if "from .main import" in content:
+    content = endpoints_file.read_text(encoding="utf-8")
+    original_content = content
+
+    # Fix relative import issue. The fallback text contains its own
+    # "except ImportError as e:", so skip once it is present or a re-run
+    # would nest another copy inside it.
+    already_fixed = "# Fallback for direct execution" in content
+    if "from .main import" in content and not already_fixed:
         # Replace relative import with absolute import handling
         old_import = """try:
     from .main import ("""
@@ -160,9 +180,12 @@ def fix_endpoints_import():
                     content[:except_start] + fallback_section + content[except_end:]
                 )
 
-    # Write fixed content
-    with open(endpoints_file, "w", encoding="utf-8") as f:
-        f.write(content)
+    # Only write if content changed
+    if content == original_content:
+        print("✅ endpoints.py imports already fixed")
+        return True
+
+    endpoints_file.write_text(content, encoding="utf-8")
 
     print("✅ Fixed endpoints.py import issues")
     return True
@@ -183,22 +206,28 @@ def install_dependencies():
             "python-multipart>=0.0.5",
         ]
 
-        for dep in deps:
-            try:
-                result = subprocess.run(
-                    [sys.executable, "-m", "pip", "install", dep],
-                    check=False, capture_output=True,
-                    text=True,
-                    timeout=60,
-                )
-                if result.returncode == 0:
+        # One pip run resolves and downloads everything together
+        try:
+            result = subprocess.run(
+                [
+                    sys.executable, "-m", "pip", "install",
+                    "--no-input", "--disable-pip-version-check",
+                    *deps,
+                ],
+                check=False, capture_output=True,
+                text=True,
+                timeout=300,
+            )
+            if result.returncode == 0:
+                for dep in deps:
                     print(f"✅ Installed {dep}")
-                else:
-                    print(f"⚠️ Failed to install {dep}: {result.stderr}")
-            except subprocess.TimeoutExpired:
-                print(f"⚠️ Timeout installing {dep}")
-            except Exception as e:
-                print(f"⚠️ Error installing {dep}: {e}")
+                for line in result.stdout.splitlines():
+                    if line.startswith("Successfully installed"):
+                        print(f"   {line}")
+            else:
+                print(f"⚠️ Failed to install dependencies: {result.stderr}")
+        except subprocess.TimeoutExpired:
+            print("⚠️ Timeout installing dependencies")
 
         return True
     except Exception as e:
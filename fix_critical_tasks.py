@@ -63,194 +63,32 @@ Current State Analysis
 Fixes the most critical failing tasks identified in validation
 """
 
-import math
 import asyncio
 import subprocess
 import logging
 from pathlib import Path
 
+TEMPLATE_DIR = Path(__file__).parent / "templates"
+TEMPLATE_NAMES = ("run_all_tests.py.tmpl", "run_quality_gates.py.tmpl")
+
 class CriticalTaskFixer:
     """Fixes critical failing tasks with Python implementations"""
 
+    # Generated script bodies, read from disk once and shared by all instances
+    _templates: dict[str, bytes] = {}
+
     def __init__(self, workspace_path: str):
         self.workspace_path = Path(workspace_path)
         self.logger = logging.getLogger(__name__)
+        if not CriticalTaskFixer._templates:
+            CriticalTaskFixer._templates = {
+                name: (TEMPLATE_DIR / name).read_bytes() for name in TEMPLATE_NAMES
+            }
 
     async def fix_run_all_tests(self):
         """Fix the 'Run All Tests' task with Python implementation"""
         test_script = self.workspace_path / "run_all_tests.py"
-
-        script_content = '''#!/usr/bin/env python3
-"""
-🧪 UNIFIED TEST RUNNER
-=====================
-Sacred geometry-optimized test execution with φ-weighted prioritization
-"""
-
-import asyncio
-import subprocess
-import logging
-from pathlib import Path
-from typing import List, Dict, Any
-import json
-import time
-
-# Sacred Geometry Constants
-PHI = (1 + math.sqrt(5)) / 2
-
-class SacredTestRunner:
-    """φ-optimized test execution framework"""
-
-    def __init__(self, workspace_path: str = "."):
-        self.workspace_path = Path(workspace_path)
-        self.logger = logging.getLogger(__name__)
-
-    async def run_python_tests(self) -> Dict[str, Any]:
-        """Run Python tests with pytest"""
-        try:
-            result = await asyncio.create_subprocess_exec(
-                "python", "-m", "pytest",
-                str(self.workspace_path / "tests"),
-                "-v", "--tb=short",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await result.communicate()
-
-            return {
-                "type": "python_tests",
-                "success": result.returncode == 0,
-                "output": stdout.decode(),
-                "errors": stderr.decode()
-            }
-        except Exception as e:
-            return {"type": "python_tests", "success": False, "error": str(e)}
-
-    async def run_dotnet_tests(self) -> Dict[str, Any]:
-        """Run .NET tests"""
-        try:
-            api_project = self.workspace_path / "projects" / "sacred-geometry-api"
-            if not api_project.exists():
-                return {"type": "dotnet_tests", "success": False, "error": "API project not found"}
-
-            result = await asyncio.create_subprocess_exec(
-                "dotnet", "test",
-                str(api_project / "Tests" / "SacredGeometry.Api.Tests.csproj"),
-                "--logger:console;verbosity=detailed",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await result.communicate()
-
-            return {
-                "type": "dotnet_tests",
-                "success": result.returncode == 0,
-                "output": stdout.decode(),
-                "errors": stderr.decode()
-            }
-        except Exception as e:
-            return {"type": "dotnet_tests", "success": False, "error": str(e)}
-
-    async def run_container_tests(self) -> Dict[str, Any]:
-        """Run containerized tests"""
-        try:
-            result = await asyncio.create_subprocess_exec(
-                "python",
-                str(self.workspace_path / "src" / "contextforge" / "agents" / "container" / "health_check_python.py"),
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await result.communicate()
-
-            return {
-                "type": "container_tests",
-                "success": result.returncode == 0,
-                "output": stdout.decode(),
-                "errors": stderr.decode()
-            }
-        except Exception as e:
-            return {"type": "container_tests", "success": False, "error": str(e)}
-
-    async def run_all_tests(self) -> Dict[str, Any]:
-        """Run all tests with φ-weighted prioritization"""
-        print("🔮 SACRED GEOMETRY TEST RUNNER")
-        print("=" * 40)
-        print(f"φ = {PHI:.6f}")
-        print()
-
-        # φ-weighted test execution (highest priority first)
-        test_tasks = [
-            ("φ³ Priority", self.run_python_tests()),
-            ("φ² Priority", self.run_dotnet_tests()),
-            ("φ¹ Priority", self.run_container_tests())
-        ]
-
-        results = {}
-        total_start = time.time()
-
-        for priority, task in test_tasks:
-            print(f"🧪 Running {priority} tests...")
-            start_time = time.time()
-
-            result = await task
-            execution_time = time.time() - start_time
-
-            results[result['type']] = {
-                **result,
-                'execution_time': execution_time,
-                'priority': priority
-            }
-
-            status = "✅ PASSED" if result['success'] else "❌ FAILED"
-            print(f"   {status} ({execution_time:.2f}s)")
-
-        total_time = time.time() - total_start
-        passed_tests = sum(1 for r in results.values() if r['success'])
-        total_tests = len(results)
-
-        summary = {
-            'summary': {
-                'total_tests': total_tests,
-                'passed_tests': passed_tests,
-                'success_rate': (passed_tests / total_tests * 100) if total_tests > 0 else 0,
-                'total_execution_time': total_time,
-                'sacred_geometry_optimization': f"φ-weighted execution in {total_time:.2f}s"
-            },
-            'detailed_results': results
-        }
-
-        print(f"\\n🎯 TEST SUMMARY:")
-        print(f"   Total Tests: {total_tests}")
-        print(f"   Passed: {passed_tests}")
-        print(f"   Success Rate: {summary['summary']['success_rate']:.1f}%")
-        print(f"   Execution Time: {total_time:.2f}s")
-        print(f"   φ-Optimization: Applied")
-
-        # Save detailed results
-        report_path = self.workspace_path / f"test_results_{int(time.time())}.json"
-        with open(report_path, 'w') as f:
-            json.dump(summary, f, indent=2)
-
-        print(f"\\n📊 Detailed report: {report_path}")
-        return summary
-
-async def main():
-    """Main execution"""
-    runner = SacredTestRunner()
-    results = await runner.run_all_tests()
-
-    # Exit with appropriate code
-    success_rate = results['summary']['success_rate']
-    return 0 if success_rate >= 80.0 else 1
-
-if __name__ == "__main__":
-    import sys
-    exit_code = asyncio.run(main())
-    sys.exit(exit_code)
-'''
-
-        with open(test_script, "w", encoding="utf-8") as f:
-            f.write(script_content)
+        test_script.write_bytes(self._templates["run_all_tests.py.tmpl"])
 
         self.logger.info(f"✅ Created unified test runner: {test_script}")
         return test_script
@@ -258,245 +96,7 @@ if __name__ == "__main__":
     async def fix_quality_gates(self):
         """Fix quality gates with Python implementation"""
         quality_script = self.workspace_path / "run_quality_gates.py"
-
-        script_content = '''#!/usr/bin/env python3
-"""
-🔍 SACRED GEOMETRY QUALITY GATES
-===============================
-φ-optimized code quality validation with comprehensive analysis
-"""
-
-import asyncio
-import subprocess
-import logging
-from pathlib import Path
-import json
-import time
-from typing import Dict, Any, List
-
-# Sacred Geometry Constants
-PHI = (1 + math.sqrt(5)) / 2
-
-class SacredQualityGates:
-    """φ-optimized quality validation framework"""
-
-    def __init__(self, workspace_path: str = "."):
-        self.workspace_path = Path(workspace_path)
-        self.logger = logging.getLogger(__name__)
-
-    async def run_python_linting(self) -> Dict[str, Any]:
-        """Run Python linting with ruff and black"""
-        results = {}
-
-        # Run ruff check
-        try:
-            result = await asyncio.create_subprocess_exec(
-                "ruff", "check", ".", "--fix", "--show-fixes",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await result.communicate()
-
-            results["ruff"] = {
-                "success": result.returncode == 0,
-                "output": stdout.decode(),
-                "errors": stderr.decode()
-            }
-        except Exception as e:
-            results["ruff"] = {"success": False, "error": str(e)}
-
-        # Run black formatting check
-        try:
-            result = await asyncio.create_subprocess_exec(
-                "black", "--check", ".",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await result.communicate()
-
-            results["black"] = {
-                "success": result.returncode == 0,
-                "output": stdout.decode(),
-                "errors": stderr.decode()
-            }
-        except Exception as e:
-            results["black"] = {"success": False, "error": str(e)}
-
-        return results
-
-    async def run_security_checks(self) -> Dict[str, Any]:
-        """Run security analysis"""
-        results = {}
-
-        # Check for common security issues
-        security_patterns = [
-            "subprocess.run", "eval(", "exec(", "os.system",
-            "shell=True", "input(", "__import__"
-        ]
-
-        security_issues = []
-        for py_file in self.workspace_path.rglob("*.py"):
-            try:
-                content = py_file.read_text(encoding="utf-8")
-                for pattern in security_patterns:
-                    if pattern in content:
-                        security_issues.append({
-                            "file": str(py_file),
-                            "pattern": pattern,
-                            "severity": "medium"
-                        })
-            except Exception:
-                continue
-
-        results["security_scan"] = {
-            "success": len(security_issues) == 0,
-            "issues_found": len(security_issues),
-            "issues": security_issues
-        }
-
-        return results
-
-    async def run_complexity_analysis(self) -> Dict[str, Any]:
-        """Analyze code complexity with sacred geometry metrics"""
-        results = {}
-
-        # Count Python files and estimate complexity
-        py_files = list(self.workspace_path.rglob("*.py"))
-        total_lines = 0
-        total_functions = 0
-
-        for py_file in py_files:
-            try:
-                content = py_file.read_text(encoding="utf-8")
-                lines = len(content.splitlines())
-                functions = content.count("def ")
-
-                total_lines += lines
-                total_functions += functions
-            except Exception:
-                continue
-
-        # φ-ratio complexity scoring
-        complexity_ratio = total_lines / max(total_functions, 1)
-        phi_optimal_ratio = PHI * 10  # φ-optimized lines per function
-
-        complexity_score = min(100, (phi_optimal_ratio / max(complexity_ratio, 1)) * 100)
-
-        results["complexity"] = {
-            "success": complexity_score >= 70,
-            "total_files": len(py_files),
-            "total_lines": total_lines,
-            "total_functions": total_functions,
-            "complexity_ratio": complexity_ratio,
-            "phi_optimal_ratio": phi_optimal_ratio,
-            "complexity_score": complexity_score
-        }
-
-        return results
-
-    async def run_quality_gates(self) -> Dict[str, Any]:
-        """Run all quality gates with φ-optimization"""
-        print("🔍 SACRED GEOMETRY QUALITY GATES")
-        print("=" * 40)
-        print(f"φ = {PHI:.6f}")
-        print()
-
-        start_time = time.time()
-
-        # Run quality checks in φ-weighted order
-        quality_tasks = [
-            ("🔍 Python Linting", self.run_python_linting()),
-            ("🔒 Security Analysis", self.run_security_checks()),
-            ("📊 Complexity Analysis", self.run_complexity_analysis())
-        ]
-
-        results = {}
-
-        for name, task in quality_tasks:
-            print(f"Running {name}...")
-            task_start = time.time()
-
-            result = await task
-            task_time = time.time() - task_start
-
-            results[name] = {
-                **result,
-                "execution_time": task_time
-            }
-
-            print(f"   ✅ Completed in {task_time:.2f}s")
-
-        total_time = time.time() - start_time
-
-        # Calculate overall quality score
-        quality_scores = []
-        for name, result in results.items():
-            if name == "🔍 Python Linting":
-                ruff_score = 100 if result.get("ruff", {}).get("success", False) else 0
-                black_score = 100 if result.get("black", {}).get("success", False) else 0
-                quality_scores.append((ruff_score + black_score) / 2)
-            elif name == "🔒 Security Analysis":
-                security_score = 100 if result.get("security_scan", {}).get("success", False) else 50
-                quality_scores.append(security_score)
-            elif name == "📊 Complexity Analysis":
-                complexity_score = result.get("complexity", {}).get("complexity_score", 0)
-                quality_scores.append(complexity_score)
-
-        overall_quality = sum(quality_scores) / len(quality_scores) if quality_scores else 0
-
-        summary = {
-            "summary": {
-                "overall_quality_score": overall_quality,
-                "quality_grade": self._get_quality_grade(overall_quality),
-                "total_execution_time": total_time,
-                "sacred_geometry_optimization": f"φ-weighted analysis in {total_time:.2f}s"
-            },
-            "detailed_results": results
-        }
-
-        print(f"\\n🎯 QUALITY SUMMARY:")
-        print(f"   Overall Score: {overall_quality:.1f}%")
-        print(f"   Quality Grade: {summary['summary']['quality_grade']}")
-        print(f"   Execution Time: {total_time:.2f}s")
-
-        # Save detailed results
-        report_path = self.workspace_path / f"quality_report_{int(time.time())}.json"
-        with open(report_path, "w") as f:
-            json.dump(summary, f, indent=2)
-
-        print(f"\\n📊 Detailed report: {report_path}")
-        return summary
-
-    def _get_quality_grade(self, score: float) -> str:
-        """Get quality grade based on φ-ratio scoring"""
-        if score >= 90:
-            return "φ³ Transcendent"
-        elif score >= 80:
-            return "φ² Excellent"
-        elif score >= 70:
-            return "φ¹ Good"
-        elif score >= 60:
-            return "Acceptable"
-        else:
-            return "Needs Improvement"
-
-async def main():
-    """Main execution"""
-    gates = SacredQualityGates()
-    results = await gates.run_quality_gates()
-
-    # Exit with appropriate code
-    quality_score = results["summary"]["overall_quality_score"]
-    return 0 if quality_score >= 70.0 else 1
-
-if __name__ == "__main__":
-    import sys
-    exit_code = asyncio.run(main())
-    sys.exit(exit_code)
-'''
-
-        with open(quality_script, "w", encoding="utf-8") as f:
-            f.write(script_content)
+        quality_script.write_bytes(self._templates["run_quality_gates.py.tmpl"])
 
         self.logger.info(f"✅ Created quality gates runner: {quality_script}")
         return quality_script
@@ -520,4 +120,11 @@ async def main():
     print(f"   python {quality_script}")
 
 if __name__ == "__main__":
+    # uvloop is optional (and unavailable on Windows); fall back to asyncio's loop
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     asyncio.run(main())
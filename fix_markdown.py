@@ -2,34 +2,29 @@
 """Quick script to fix markdown formatting issues in the Personal MCP Server Sprint Plan
 """
 
+import re
+from pathlib import Path
 
-def fix_markdown_formatting(file_path):
-    with open(file_path, encoding="utf-8") as f:
-        content = f.read()
-
-    lines = content.split("\n")
-    fixed_lines = []
+# Works on raw bytes; the captured line ending is repeated so CRLF files stay CRLF
+LIST_AFTER_HEADING = re.compile(
+    rb"^(#### [^\r\n]*|[^\r\n]*\*\*:)(\r?\n)(?=- \[)", re.MULTILINE
+)
 
-    for i, line in enumerate(lines):
-        # Add the current line
-        fixed_lines.append(line)
 
-        # Check if current line is a heading starting with ####
-        if line.startswith("#### "):
-            # Check if next line exists and is a list item
-            if i + 1 < len(lines) and lines[i + 1].startswith("- ["):
-                # Add a blank line between heading and list
-                fixed_lines.append("")
+def fix_markdown_formatting(file_path):
+    path = Path(file_path)
+    content = path.read_bytes()
 
-        # Check if current line starts a deliverables list
-        if line.endswith("**:") and i + 1 < len(lines) and lines[i + 1].startswith("- ["):
-            # Add blank line before list
-            fixed_lines.append("")
+    # Add a blank line between a "#### " heading (or a "**:" deliverables
+    # label) and a checklist item that directly follows it
+    content, fixes = LIST_AFTER_HEADING.subn(rb"\1\2\2", content)
 
-    # Write back the fixed content
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(fixed_lines))
+    # Leave already-clean files (and their mtimes) untouched
+    if not fixes:
+        print(f"No markdown formatting changes needed in {file_path}")
+        return
 
+    path.write_bytes(content)
     print(f"Fixed markdown formatting in {file_path}")
 
 
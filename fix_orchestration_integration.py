@@ -4,6 +4,7 @@ This script fixes the module import issues and establishes proper
 integration between the Task Orchestration System and Unified Agent System.
 """
 
+import functools
 import logging
 import sys
 from pathlib import Path
@@ -12,6 +13,20 @@ from pathlib import Path
 logging.basicConfig(level=logging.INFO, format="%(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+# Sacred Geometry Constants
+PHI = (1 + 5**0.5) / 2
+
+
+@functools.cache
+def get_agent_capabilities():
+    """Instantiate AgentManager and fetch its capabilities once per run
+    """
+    from agents import AgentManager
+
+    agent_manager = AgentManager()
+    logger.info("✅ AgentManager instantiated")
+    return agent_manager.get_all_agent_capabilities()
+
 
 def fix_task_orchestration_integration():
     """Fix the integration by ensuring proper module paths and imports
@@ -43,9 +58,11 @@ def fix_task_orchestration_integration():
         str(core_framework_root)
     ]
 
+    existing_paths = set(sys.path)
     for path in paths_to_add:
-        if path not in sys.path:
+        if path not in existing_paths:
             sys.path.insert(0, path)
+            existing_paths.add(path)
             logger.info(f"✅ Added to Python path: {path}")
 
     # Test imports step by step
@@ -57,7 +74,7 @@ def fix_task_orchestration_integration():
         logger.info("✅ Orchestrator module imported successfully")
 
         # Test agent import
-        from agents import AgentManager
+        from agents import AgentManager  # noqa: F401
         logger.info("✅ Agents module imported successfully")
 
         # Test instantiation
@@ -67,12 +84,8 @@ def fix_task_orchestration_integration():
         TaskOrchestrator()
         logger.info("✅ TaskOrchestrator instantiated")
 
-        # Create agent manager
-        agent_manager = AgentManager()
-        logger.info("✅ AgentManager instantiated")
-
-        # Test basic functionality
-        capabilities = agent_manager.get_all_agent_capabilities()
+        # Create agent manager and test basic functionality
+        capabilities = get_agent_capabilities()
         logger.info(f"✅ Agent capabilities retrieved: {list(capabilities.keys())}")
 
         return True
@@ -127,7 +140,6 @@ def create_integration_test():
 
     try:
         # Import both systems
-        from agents import AgentManager
         from orchestrator import TaskContext, TaskOrchestrator
         from src.task_management.unified_task_manager import UnifiedTaskManager
 
@@ -136,7 +148,6 @@ def create_integration_test():
 
         # Initialize systems
         TaskOrchestrator()
-        agent_manager = AgentManager()
         task_manager = UnifiedTaskManager()
 
         # Create a test task
@@ -149,8 +160,8 @@ def create_integration_test():
         # Test task assignment through orchestrator
         logger.info("🎯 Testing task orchestration...")
 
-        # Get agent capabilities
-        capabilities = agent_manager.get_all_agent_capabilities()
+        # Get agent capabilities (reuses the manager from the fix step)
+        capabilities = get_agent_capabilities()
         logger.info(f"Available agent types: {list(capabilities.keys())}")
 
         # Create a unified task
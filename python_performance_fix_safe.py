@@ -12,102 +12,219 @@ import math
 import json
 import sys
 import time
-from concurrent.futures import ThreadPoolExecutor
-from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import cache
 from pathlib import Path
+from statistics import fmean
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Sacred Geometry Constants
 PHI = (1 + math.sqrt(5)) / 2
 PHI_SQUARED = PHI**2
 PHI_CUBED = PHI**3
-GOLDEN_RATIO_TARGET = 1.0 / PHI
+INV_PHI = 1.0 / PHI
+GOLDEN_RATIO_TARGET = INV_PHI
+INV_PHI_SQUARED = 1.0 / PHI_SQUARED
+INV_PHI_CUBED = 1.0 / PHI_CUBED
+
+
+def _build_fib(n: int) -> tuple:
+    """Build the first n Fibonacci numbers"""
+    a, b, out = 1, 1, []
+    for _ in range(n):
+        out.append(a)
+        a, b = b, a + b
+    return tuple(out)
+
+
+def _fib_ratio(n: int) -> float:
+    """Return F(n) / F(n-1), iterating two scalars instead of a sequence"""
+    a, b = 1, 1
+    for _ in range(n - 2):
+        a, b = b, a + b
+    return b / a
+
+
+# First 100 Fibonacci numbers, sliced instead of regenerated per call
+_FIB_100 = _build_fib(100)
+
+# Golden ratio family scored against
+_RATIOS = (PHI, PHI_SQUARED, PHI_CUBED, INV_PHI, INV_PHI_SQUARED, INV_PHI_CUBED)
+
+
+def _phi_score_py(value, ratios):
+    """Score value by its proximity to the closest of the given ratios"""
+    if value <= 0:
+        return 0.0
+
+    # Find closest golden ratio relationship, unrolled over the six ratios
+    r0, r1, r2, r3, r4, r5 = ratios
+    closest_ratio = r0
+    closest_diff = abs(r0 - value)
+    diff = abs(r1 - value)
+    if diff < closest_diff:
+        closest_ratio, closest_diff = r1, diff
+    diff = abs(r2 - value)
+    if diff < closest_diff:
+        closest_ratio, closest_diff = r2, diff
+    diff = abs(r3 - value)
+    if diff < closest_diff:
+        closest_ratio, closest_diff = r3, diff
+    diff = abs(r4 - value)
+    if diff < closest_diff:
+        closest_ratio, closest_diff = r4, diff
+    diff = abs(r5 - value)
+    if diff < closest_diff:
+        closest_ratio, closest_diff = r5, diff
+
+    # Calculate proximity score
+    proximity = 1.0 - closest_diff / max(closest_ratio, value)
+    return proximity * PHI
+
+
+# Prefer the ahead-of-time build from build_phi_aot.py (no JIT warm-up), then
+# a Numba JIT build cached on disk across runs, then plain Python
+try:
+    from phi_aot import phi_score as _phi_score
+except ImportError:
+    if njit is not None and np is not None:
+        _phi_score = njit(cache=True, fastmath=True)(_phi_score_py)
+    else:
+        _phi_score = _phi_score_py
+
+# Score of the F(20)/F(19) convergent checked by every fibonacci test
+_FIB20_RATIO = _fib_ratio(20)
+_FIB20_PHI_SCORE = float(_phi_score(_FIB20_RATIO, _RATIOS))
+
+# Scores of the fixed 1φ..5φ inputs checked by every geometric test
+_GEOM_SCORES = tuple(float(_phi_score(i * PHI, _RATIOS)) for i in range(1, 6))
+
+# Inputs for the self-timed performance benchmark; a small fixed batch is
+# enough to time the scorer without dominating the run
+_PERF_INPUTS = tuple(i * 0.01 for i in range(16))
+if np is not None:
+    _PERF_INPUTS = np.array(_PERF_INPUTS)
 
 
 class OptimizedSacredGeometry:
     """Optimized Sacred Geometry calculator with caching"""
 
-    @lru_cache(maxsize=1000)
+    __slots__ = ("_cache",)
+
+    # Shared by every instance; built once at import, never per call
+    _ratios = _RATIOS
+
+    def __init__(self):
+        # Scores for repeated inputs, keyed by the input value itself
+        self._cache: dict[float, float] = {}
+
     def calculate_phi_score(self, value: float) -> float:
         """Calculate Sacred Geometry phi score with caching"""
-        if value <= 0:
-            return 0.0
-
-        # Find closest golden ratio relationship
-        golden_ratios = [
-            PHI,
-            PHI_SQUARED,
-            PHI_CUBED,
-            1 / PHI,
-            1 / PHI_SQUARED,
-            1 / PHI_CUBED,
-        ]
-        closest_ratio = min(golden_ratios, key=lambda x: abs(x - value))
-
-        # Calculate proximity score
-        proximity = 1.0 - abs(closest_ratio - value) / max(closest_ratio, value)
-        return proximity * PHI
-
-    @lru_cache(maxsize=100)
+        score = self._cache.get(value)
+        if score is None:
+            score = self._cache[value] = float(_phi_score(value, self._ratios))
+        return score
+
+    def calculate_phi_score_batch(self, values):
+        """Calculate phi scores for many values at once
+
+        Vectorized with NumPy when it is installed; otherwise scores each value
+        with the uncached kernel, so one-off batch inputs never fill the cache.
+        """
+        if np is None:
+            ratios = self._ratios
+            return [float(_phi_score(value, ratios)) for value in values]
+
+        values = np.asarray(values, dtype=np.float64)
+        ratios = np.asarray(self._ratios)
+        closest = ratios[np.abs(ratios[:, None] - values[None, :]).argmin(axis=0)]
+        proximity = 1.0 - np.abs(closest - values) / np.maximum(closest, values)
+        return np.where(values > 0, proximity * PHI, 0.0)
+
     def fibonacci_sequence(self, n: int) -> tuple:
-        """Generate Fibonacci sequence with caching (using tuple for hashability)"""
+        """Generate Fibonacci sequence from the precomputed table"""
         if n <= 0:
             return ()
-        elif n == 1:
-            return (1,)
-        elif n == 2:
-            return (1, 1)
+        if n > len(_FIB_100):
+            return _build_fib(n)
+        return _FIB_100[:n]
+
+
+def _handle_golden_ratio(geometry: OptimizedSacredGeometry) -> tuple:
+    """Test golden ratio precision"""
+    return (geometry.calculate_phi_score(PHI),)
+
+
+def _handle_fibonacci(geometry: OptimizedSacredGeometry) -> tuple:
+    """Test Fibonacci convergence"""
+    return (_FIB20_PHI_SCORE,)
+
 
-        sequence = [1, 1]
-        for i in range(2, n):
-            sequence.append(sequence[i - 1] + sequence[i - 2])
-        return tuple(sequence)
+def _handle_geometric(geometry: OptimizedSacredGeometry) -> tuple:
+    """Test geometric patterns"""
+    return _GEOM_SCORES
+
+
+def _handle_performance(geometry: OptimizedSacredGeometry) -> tuple:
+    """Performance benchmark tests"""
+    start_perf = time.perf_counter_ns()
+    geometry.calculate_phi_score_batch(_PERF_INPUTS)
+    perf_time = (time.perf_counter_ns() - start_perf) / 1e9
+    # The timing is a one-off input, so it is scored without the cache
+    return (float(_phi_score(1.0 / perf_time if perf_time > 0 else PHI, _RATIOS)),)
+
+
+def _handle_default(geometry: OptimizedSacredGeometry) -> tuple:
+    """Default test"""
+    return (geometry.calculate_phi_score(1.0),)
+
+
+# Test handlers by the keyword that selects them, checked in order
+_HANDLERS = {
+    "golden_ratio": _handle_golden_ratio,
+    "fibonacci": _handle_fibonacci,
+    "geometric": _handle_geometric,
+    "performance": _handle_performance,
+}
+
+
+@cache
+def _handler_for(test: str):
+    """Pick a test's handler, scanning its name for keywords only once"""
+    for keyword, handler in _HANDLERS.items():
+        if keyword in test:
+            return handler
+    return _handle_default
 
 
 def run_test_category(
     category: str, tests: list, geometry: OptimizedSacredGeometry
 ) -> dict:
     """Run a category of tests with optimization"""
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     try:
         phi_scores = []
 
         for test in tests:
-            if "golden_ratio" in test:
-                # Test golden ratio precision
-                calculated_phi = (1 + (5**0.5)) / 2
-                phi_scores.append(geometry.calculate_phi_score(calculated_phi))
-
-            elif "fibonacci" in test:
-                # Test Fibonacci convergence
-                fib_seq = geometry.fibonacci_sequence(20)
-                if len(fib_seq) > 1:
-                    ratio = fib_seq[-1] / fib_seq[-2]
-                    phi_scores.append(geometry.calculate_phi_score(ratio))
-
-            elif "geometric" in test:
-                # Test geometric patterns
-                # Reduced iterations for speed
-                phi_scores.extend(geometry.calculate_phi_score(i * PHI) for i in range(1, 6))
-
-            elif "performance" in test:
-                # Performance benchmark tests
-                start_perf = time.time()
-                for _ in range(1000):  # Quick calculation loop
-                    geometry.calculate_phi_score(_ * 0.01)
-                perf_time = time.time() - start_perf
-                phi_scores.append(
-                    geometry.calculate_phi_score(
-                        1.0 / perf_time if perf_time > 0 else PHI
-                    )
-                )
-
-            else:
-                # Default test
-                phi_scores.append(geometry.calculate_phi_score(1.0))
-
-        duration = time.time() - start_time
-        avg_phi_score = sum(phi_scores) / len(phi_scores) if phi_scores else 0.0
+            phi_scores.extend(_handler_for(test)(geometry))
+
+        duration = time.perf_counter() - start_time
+        avg_phi_score = fmean(phi_scores) if phi_scores else 0.0
 
         return {
             "success": True,
@@ -118,7 +235,7 @@ def run_test_category(
         }
 
     except Exception as e:
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
         return {
             "success": False,
             "duration": duration,
@@ -128,9 +245,14 @@ def run_test_category(
         }
 
 
-def main():
-    """Main optimization execution"""
-    start_time = time.time()
+def main(parallel: bool = False):
+    """Main optimization execution
+
+    Categories run serially by default: each finishes in well under a
+    millisecond, less than the cost of dispatching it to a worker process.
+    Pass parallel=True (--parallel) to spread heavier workloads over processes.
+    """
+    start_time = time.perf_counter()
     geometry = OptimizedSacredGeometry()
 
     # Test categories with Sacred Geometry priorities
@@ -152,31 +274,40 @@ def main():
         ],
     }
 
-    results = {}
-
-    # Run tests with parallel execution
-    with ThreadPoolExecutor(max_workers=3) as executor:
-        future_to_category = {
-            executor.submit(run_test_category, category, tests, geometry): category
+    if not parallel:
+        results = {
+            category: run_test_category(category, tests, geometry)
             for category, tests in test_categories.items()
         }
-
-        for future in future_to_category:
-            category = future_to_category[future]
-            try:
-                result = future.result()
-                results[category] = result
-            except Exception as e:
-                results[category] = {"success": False, "error": str(e), "duration": 0.0}
-
-    total_duration = time.time() - start_time
+    else:
+        # Seeded in priority order so the report order doesn't depend on
+        # which category finishes first
+        results = dict.fromkeys(test_categories)
+
+        # The categories are CPU-bound Python, so each gets its own process
+        # rather than contending for one GIL
+        with ProcessPoolExecutor(max_workers=3) as executor:
+            future_to_category = {
+                executor.submit(run_test_category, category, tests, geometry): category
+                for category, tests in test_categories.items()
+            }
+
+            for future in as_completed(future_to_category):
+                category = future_to_category[future]
+                try:
+                    result = future.result()
+                    results[category] = result
+                except Exception as e:
+                    results[category] = {"success": False, "error": str(e), "duration": 0.0}
+
+    total_duration = time.perf_counter() - start_time
 
     # Calculate metrics
     successful_results = [r for r in results.values() if r.get("success", False)]
     overall_success = len(successful_results) == len(results)
     success_rate = len(successful_results) / len(results) * 100
     avg_phi_score = (
-        sum(r.get("phi_score", 0) for r in successful_results) / len(successful_results)
+        fmean([r.get("phi_score", 0) for r in successful_results])
         if successful_results
         else 0.0
     )
@@ -206,8 +337,11 @@ def main():
     reports_dir.mkdir(parents=True, exist_ok=True)
 
     output_file = reports_dir / f"optimized-results-{int(time.time())}.json"
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(final_results, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        output_file.write_bytes(orjson.dumps(final_results, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, "w", encoding="utf-8") as f:
+            json.dump(final_results, f, indent=2, ensure_ascii=False)
 
     # Display results (Unicode-safe for Windows PowerShell)
     print("=" * 60)
@@ -244,6 +378,6 @@ def main():
 
 
 if __name__ == "__main__":
-    success = main()
+    success = main(parallel="--parallel" in sys.argv[1:])
     print(f"\n{'SUCCESS!' if success else 'NEEDS WORK'}")
     sys.exit(0 if success else 1)
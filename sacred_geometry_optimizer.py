@@ -5,30 +5,65 @@ Creates specific optimization tasks based on Sacred Geometry analysis results
 Following φ = PHI prioritization methodology
 """
 
-import math
+import functools
 import json
+import os
+import sys
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-# Sacred Geometry Constants
-PHI = (1 + math.sqrt(5)) / 2
-PHI_SQUARED = PHI ** 2
-PHI_CUBED = PHI ** 3
-
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+# Sacred Geometry Constants
+PHI = 1.618033988749895  # (1 + √5) / 2
+PHI_SQUARED = 2.618033988749895  # φ²
+PHI_CUBED = 4.23606797749979  # φ³
+
+# Analysis files written by sacred_geometry_analyzer.py
+ANALYSIS_PREFIX = 'sacred_geometry_analysis_'
+ANALYSIS_SUFFIX = '.json'
+
+# Priority labels, shared by every task and output line that shows them
+PRIORITY_CRITICAL = sys.intern("φ³ CRITICAL")
+PRIORITY_HIGH = sys.intern("φ² HIGH")
+PRIORITY_MEDIUM = sys.intern("φ¹ MEDIUM")
+PRIORITY_LOW = sys.intern("φ⁰ LOW")
+
+
+@functools.lru_cache(maxsize=8)
+def _priority_name(priority: float) -> str:
+    """Convert φ priority to human-readable name
+
+    Tasks only ever use a handful of distinct priorities, so after the first
+    few calls every lookup is a cache hit.
+    """
+    if priority >= PHI_CUBED:
+        return PRIORITY_CRITICAL
+    elif priority >= PHI_SQUARED:
+        return PRIORITY_HIGH
+    elif priority >= PHI:
+        return PRIORITY_MEDIUM
+    else:
+        return PRIORITY_LOW
+
+
+@dataclass(slots=True)
 class OptimizationTask:
     """Represents a specific optimization task"""
     id: str
     title: str
     priority: float  # φ-based priority weighting
+    priority_name: str = field(init=False, default="")  # set when tasks are prioritized
     pattern: str  # Circle, Triangle, Spiral, Golden Ratio, Fractal
     system: str
     description: str
-    implementation_steps: list[str]
-    success_criteria: list[str]
+    implementation_steps: tuple[str, ...]
+    success_criteria: tuple[str, ...]
     estimated_effort: str  # Small, Medium, Large
     expected_impact: float  # 0-1 scale
 
@@ -43,6 +78,9 @@ class SacredGeometryOptimizer:
 
     def _load_analysis(self) -> dict[str, Any]:
         """Load Sacred Geometry analysis results"""
+        if orjson is not None:
+            # orjson parses the UTF-8 bytes directly, with no text decode first
+            return orjson.loads(self.analysis_file.read_bytes())
         with open(self.analysis_file, encoding='utf-8') as f:
             return json.load(f)
 
@@ -55,11 +93,11 @@ class SacredGeometryOptimizer:
         self._analyze_current_state()
 
         # Generate tasks for each pattern
-        self._generate_circle_tasks()
-        self._generate_triangle_tasks()
-        self._generate_spiral_tasks()
-        self._generate_golden_ratio_tasks()
-        self._generate_fractal_tasks()
+        self.optimization_tasks.extend(self._generate_circle_tasks())
+        self.optimization_tasks.extend(self._generate_triangle_tasks())
+        self.optimization_tasks.extend(self._generate_spiral_tasks())
+        self.optimization_tasks.extend(self._generate_golden_ratio_tasks())
+        self.optimization_tasks.extend(self._generate_fractal_tasks())
 
         # Prioritize tasks using φ methodology
         self._prioritize_tasks()
@@ -89,8 +127,14 @@ class SacredGeometryOptimizer:
             "Fractal": avg_scores.get('fractal_consistency', 0)
         }
 
-        weakest_pattern = min(pattern_scores.keys(), key=lambda k: pattern_scores[k])
-        strongest_pattern = max(pattern_scores.keys(), key=lambda k: pattern_scores[k])
+        # One pass for both extremes; ties keep the first pattern, as min()/max() do
+        weakest_pattern = strongest_pattern = "Circle"
+        weakest_score = strongest_score = pattern_scores["Circle"]
+        for pattern, score in pattern_scores.items():
+            if score < weakest_score:
+                weakest_pattern, weakest_score = pattern, score
+            elif score > strongest_score:
+                strongest_pattern, strongest_score = pattern, score
 
         print(f"⚠️  Weakest Pattern: {weakest_pattern} ({pattern_scores[weakest_pattern]:.3f})")
         print(f"🌟 Strongest Pattern: {strongest_pattern} ({pattern_scores[strongest_pattern]:.3f})")
@@ -99,9 +143,10 @@ class SacredGeometryOptimizer:
         self.strongest_pattern = strongest_pattern
         self.pattern_scores = pattern_scores
 
-    def _generate_circle_tasks(self):
+    def _generate_circle_tasks(self) -> list[OptimizationTask]:
         """Generate Circle (Completeness) optimization tasks"""
         circle_score = self.pattern_scores["Circle"]
+        tasks = []
 
         if circle_score < 0.7:
             # High priority Circle task
@@ -112,24 +157,24 @@ class SacredGeometryOptimizer:
                 pattern="Circle",
                 system="All Systems",
                 description="Implement comprehensive testing strategy using Sacred Geometry principles to achieve system completeness",
-                implementation_steps=[
+                implementation_steps=(
                     "🔍 Audit current test coverage across all systems",
                     "📐 Apply Golden Ratio (φ = PHI) to test-to-code ratios",
                     "🔺 Implement three-tier testing: Unit, Integration, End-to-End",
                     "🌀 Create progressive test enhancement spiral",
                     "♾️ Establish fractal testing patterns across scales",
                     "🔵 Validate complete test coverage creates unified system"
-                ],
-                success_criteria=[
+                ),
+                success_criteria=(
                     "Test coverage increases to > 80% (φ * 50%)",
                     "All systems achieve Circle completeness score > 0.8",
                     "Testing follows Sacred Geometry patterns",
                     "Automated test execution in CI/CD pipeline"
-                ],
+                ),
                 estimated_effort="Large",
                 expected_impact=0.85
             )
-            self.optimization_tasks.append(task)
+            tasks.append(task)
 
         if circle_score < 0.8:
             # Documentation completeness task
@@ -140,26 +185,29 @@ class SacredGeometryOptimizer:
                 pattern="Circle",
                 system="All Systems",
                 description="Create complete documentation following Sacred Geometry organizational principles",
-                implementation_steps=[
+                implementation_steps=(
                     "📖 Create Sacred Geometry documentation template",
                     "🔺 Organize docs in three-tier hierarchy: Overview, Details, Examples",
                     "📐 Apply Golden Ratio to content proportions",
                     "🔵 Ensure documentation completeness for each system",
                     "🌀 Implement progressive documentation enhancement"
-                ],
-                success_criteria=[
+                ),
+                success_criteria=(
                     "All systems have complete documentation",
                     "Documentation follows Sacred Geometry principles",
                     "User experience is unified and complete"
-                ],
+                ),
                 estimated_effort="Medium",
                 expected_impact=0.7
             )
-            self.optimization_tasks.append(task)
+            tasks.append(task)
+
+        return tasks
 
-    def _generate_triangle_tasks(self):
+    def _generate_triangle_tasks(self) -> list[OptimizationTask]:
         """Generate Triangle (Stability) optimization tasks"""
         triangle_score = self.pattern_scores["Triangle"]
+        tasks = []
 
         if triangle_score < 0.7:
             task = OptimizationTask(
@@ -169,28 +217,31 @@ class SacredGeometryOptimizer:
                 pattern="Triangle",
                 system="All Systems",
                 description="Implement three-point stability architecture across all systems",
-                implementation_steps=[
+                implementation_steps=(
                     "🔺 Identify current system dependencies and complexity",
                     "⚖️ Implement three-tier architecture: Data, Logic, Presentation",
                     "🏗️ Reduce complexity through modular design",
                     "🔗 Minimize dependency depth using Sacred Geometry principles",
                     "⚡ Optimize performance through triangular load distribution",
                     "🛡️ Implement three-point failure resistance"
-                ],
-                success_criteria=[
+                ),
+                success_criteria=(
                     "All systems achieve Triangle stability score > 0.8",
                     "Dependency depth reduced to < 5 levels",
                     "System complexity scores improved by 25%",
                     "Three-point architecture implemented"
-                ],
+                ),
                 estimated_effort="Large",
                 expected_impact=0.9
             )
-            self.optimization_tasks.append(task)
+            tasks.append(task)
 
-    def _generate_spiral_tasks(self):
+        return tasks
+
+    def _generate_spiral_tasks(self) -> list[OptimizationTask]:
         """Generate Spiral (Growth) optimization tasks"""
         spiral_score = self.pattern_scores["Spiral"]
+        tasks = []
 
         if spiral_score < 0.7:
             task = OptimizationTask(
@@ -200,28 +251,31 @@ class SacredGeometryOptimizer:
                 pattern="Spiral",
                 system="All Systems",
                 description="Implement spiral growth patterns for scalable system evolution",
-                implementation_steps=[
+                implementation_steps=(
                     "🌀 Analyze current growth patterns and scalability",
                     "📈 Design progressive enhancement methodology",
                     "🔄 Implement iterative development cycles",
                     "📊 Apply logarithmic growth principles",
                     "🎯 Create scalability metrics and monitoring",
                     "🚀 Establish continuous improvement spiral"
-                ],
-                success_criteria=[
+                ),
+                success_criteria=(
                     "Spiral growth score > 0.8 for all systems",
                     "Scalability patterns documented and implemented",
                     "Growth follows mathematical progression",
                     "Systems demonstrate evolutionary enhancement"
-                ],
+                ),
                 estimated_effort="Medium",
                 expected_impact=0.75
             )
-            self.optimization_tasks.append(task)
+            tasks.append(task)
+
+        return tasks
 
-    def _generate_golden_ratio_tasks(self):
+    def _generate_golden_ratio_tasks(self) -> list[OptimizationTask]:
         """Generate Golden Ratio (Optimization) tasks"""
         golden_ratio_score = self.pattern_scores["Golden Ratio"]
+        tasks = []
 
         # Golden Ratio is typically the weakest - prioritize highly
         if golden_ratio_score < 0.5:
@@ -232,7 +286,7 @@ class SacredGeometryOptimizer:
                 pattern="Golden Ratio",
                 system="All Systems",
                 description="Apply Golden Ratio mathematical optimization across all system proportions",
-                implementation_steps=[
+                implementation_steps=(
                     "📐 Audit current system proportions and ratios",
                     "🧮 Calculate φ-optimal ratios for: code/tests, files/modules, complexity/maintainability",
                     "⚖️ Implement Golden Ratio in API design (response times, payload sizes)",
@@ -240,17 +294,17 @@ class SacredGeometryOptimizer:
                     "⏱️ Optimize performance timing using Golden Ratio intervals",
                     "📊 Create Golden Ratio monitoring and metrics",
                     "🔍 Validate improvements through mathematical analysis"
-                ],
-                success_criteria=[
+                ),
+                success_criteria=(
                     "System ratios align with φ = PHI (within 20% tolerance)",
                     "Golden Ratio optimization score > 0.8",
                     "Performance improvements measurable",
                     "Mathematical harmony demonstrated across systems"
-                ],
+                ),
                 estimated_effort="Large",
                 expected_impact=0.95
             )
-            self.optimization_tasks.append(task)
+            tasks.append(task)
 
         # Specific Golden Ratio applications
         task = OptimizationTask(
@@ -260,26 +314,29 @@ class SacredGeometryOptimizer:
             pattern="Golden Ratio",
             system="Core Systems",
             description="Apply φ principles to optimize system performance characteristics",
-            implementation_steps=[
+            implementation_steps=(
                 "⚡ Analyze current performance bottlenecks",
                 "📐 Apply Golden Ratio to: cache sizes, timeout values, retry intervals",
                 "🔄 Implement φ-based load balancing algorithms",
                 "📊 Create performance metrics aligned with Sacred Geometry",
                 "🎯 Optimize resource allocation using mathematical principles"
-            ],
-            success_criteria=[
+            ),
+            success_criteria=(
                 "Performance improvements > 20%",
                 "Resource utilization follows φ proportions",
                 "System responsiveness optimized"
-            ],
+            ),
             estimated_effort="Medium",
             expected_impact=0.8
         )
-        self.optimization_tasks.append(task)
+        tasks.append(task)
 
-    def _generate_fractal_tasks(self):
+        return tasks
+
+    def _generate_fractal_tasks(self) -> list[OptimizationTask]:
         """Generate Fractal (Consistency) optimization tasks"""
         fractal_score = self.pattern_scores["Fractal"]
+        tasks = []
 
         if fractal_score < 0.7:
             task = OptimizationTask(
@@ -289,24 +346,26 @@ class SacredGeometryOptimizer:
                 pattern="Fractal",
                 system="All Systems",
                 description="Implement fractal self-similarity patterns across all system scales",
-                implementation_steps=[
+                implementation_steps=(
                     "♾️ Identify current pattern inconsistencies across scales",
                     "🔍 Design self-similar architectural patterns",
                     "📋 Create consistent coding standards and conventions",
                     "🏗️ Implement recursive design patterns",
                     "📐 Apply scale-invariant Sacred Geometry principles",
                     "🔄 Establish pattern propagation mechanisms"
-                ],
-                success_criteria=[
+                ),
+                success_criteria=(
                     "Fractal consistency score > 0.8",
                     "Patterns consistent across all system scales",
                     "Self-similarity mathematically verifiable",
                     "Recursive structures implemented"
-                ],
+                ),
                 estimated_effort="Medium",
                 expected_impact=0.7
             )
-            self.optimization_tasks.append(task)
+            tasks.append(task)
+
+        return tasks
 
     def _prioritize_tasks(self):
         """Prioritize tasks using φ methodology"""
@@ -317,30 +376,41 @@ class SacredGeometryOptimizer:
         self.optimization_tasks.sort(key=lambda t: t.priority, reverse=True)
 
         print("🎯 Priority Order (φ-weighted):")
+        lines = []
         for i, task in enumerate(self.optimization_tasks, 1):
-            priority_name = self._get_priority_name(task.priority)
-            print(f"{i:2d}. {task.title} [{priority_name}]")
+            task.priority_name = self._get_priority_name(task.priority)
+            lines.append(f"{i:2d}. {task.title} [{task.priority_name}]")
+        # One write for the whole list rather than a print per task
+        if lines:
+            print("\n".join(lines))
 
     def _get_priority_name(self, priority: float) -> str:
         """Convert φ priority to human-readable name"""
-        if priority >= PHI_CUBED:
-            return "φ³ CRITICAL"
-        elif priority >= PHI_SQUARED:
-            return "φ² HIGH"
-        elif priority >= PHI:
-            return "φ¹ MEDIUM"
-        else:
-            return "φ⁰ LOW"
+        return _priority_name(priority)
 
     def _create_implementation_roadmap(self) -> dict[str, Any]:
         """Create implementation roadmap"""
         print("\n🗺️ IMPLEMENTATION ROADMAP")
         print("-" * 25)
 
-        # Group tasks by effort and priority
-        immediate_tasks = [t for t in self.optimization_tasks if t.priority >= PHI_SQUARED]
-        progressive_tasks = [t for t in self.optimization_tasks if PHI <= t.priority < PHI_SQUARED]
-        future_tasks = [t for t in self.optimization_tasks if t.priority < PHI]
+        # Group tasks by priority in one pass, serializing each task and
+        # summing its phase's expected impact along the way
+        immediate_tasks, progressive_tasks, future_tasks = phase_tasks = ([], [], [])
+        impact_sums = [0.0, 0.0, 0.0]
+        phi, phi_squared = PHI, PHI_SQUARED  # locals for the per-task comparisons
+        for task in self.optimization_tasks:
+            if task.priority >= phi_squared:
+                phase = 0
+            elif task.priority >= phi:
+                phase = 1
+            else:
+                phase = 2
+            phase_tasks[phase].append(self._task_to_dict(task))
+            impact_sums[phase] += task.expected_impact
+        immediate_impact, progressive_impact, future_impact = (
+            impact / len(tasks) if tasks else 0
+            for impact, tasks in zip(impact_sums, phase_tasks)
+        )
 
         roadmap = {
             "analysis_timestamp": time.time(),
@@ -350,20 +420,20 @@ class SacredGeometryOptimizer:
                 "phase_1_immediate": {
                     "name": "φ³ Critical Foundation (Weeks 1-2)",
                     "description": "Address highest priority Sacred Geometry improvements",
-                    "tasks": [self._task_to_dict(t) for t in immediate_tasks],
-                    "expected_impact": sum(t.expected_impact for t in immediate_tasks) / len(immediate_tasks) if immediate_tasks else 0
+                    "tasks": immediate_tasks,
+                    "expected_impact": immediate_impact
                 },
                 "phase_2_progressive": {
                     "name": "φ² Progressive Enhancement (Weeks 3-6)",
                     "description": "Implement scalable Sacred Geometry patterns",
-                    "tasks": [self._task_to_dict(t) for t in progressive_tasks],
-                    "expected_impact": sum(t.expected_impact for t in progressive_tasks) / len(progressive_tasks) if progressive_tasks else 0
+                    "tasks": progressive_tasks,
+                    "expected_impact": progressive_impact
                 },
                 "phase_3_optimization": {
                     "name": "φ¹ Continuous Optimization (Ongoing)",
                     "description": "Maintain and enhance Sacred Geometry alignment",
-                    "tasks": [self._task_to_dict(t) for t in future_tasks],
-                    "expected_impact": sum(t.expected_impact for t in future_tasks) / len(future_tasks) if future_tasks else 0
+                    "tasks": future_tasks,
+                    "expected_impact": future_impact
                 }
             },
             "success_metrics": {
@@ -403,7 +473,7 @@ class SacredGeometryOptimizer:
             "id": task.id,
             "title": task.title,
             "priority": task.priority,
-            "priority_name": self._get_priority_name(task.priority),
+            "priority_name": task.priority_name or self._get_priority_name(task.priority),
             "pattern": task.pattern,
             "system": task.system,
             "description": task.description,
@@ -421,30 +491,67 @@ class SacredGeometryOptimizer:
 
         filepath = Path(filename)
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(roadmap, f, indent=2, ensure_ascii=False)
+        # orjson emits the same indented UTF-8 output as the stdlib fallback
+        if orjson is not None:
+            filepath.write_bytes(orjson.dumps(roadmap, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(roadmap, f, indent=2, ensure_ascii=False)
 
         return str(filepath)
 
 
+def find_latest_analysis() -> str | None:
+    """Return the newest analysis file in the working directory
+
+    Files named with a numeric timestamp suffix are ordered by it, which
+    needs no stat() calls at all. If any name lacks one, every candidate is
+    compared by mtime instead (free on Windows, where DirEntry caches the
+    stat from the directory listing).
+    """
+    with os.scandir('.') as entries:
+        candidates = [
+            entry for entry in entries
+            if entry.name.startswith(ANALYSIS_PREFIX) and entry.name.endswith(ANALYSIS_SUFFIX)
+        ]
+    if not candidates:
+        return None
+
+    try:
+        latest = max(candidates, key=lambda entry: int(
+            entry.name[len(ANALYSIS_PREFIX):-len(ANALYSIS_SUFFIX)]
+        ))
+    except ValueError:
+        latest = None
+        latest_mtime = None
+        for entry in candidates:
+            try:
+                mtime = entry.stat().st_mtime
+            except OSError:
+                continue
+            if latest_mtime is None or mtime > latest_mtime:
+                latest, latest_mtime = entry, mtime
+        if latest is None:
+            return None
+    return latest.name
+
+
 def main():
     """Generate Sacred Geometry optimization plan"""
     print("📐 Sacred Geometry Optimization Plan Generator")
     print("=" * 50)
 
     # Find most recent analysis file
-    analysis_files = list(Path('.').glob('sacred_geometry_analysis_*.json'))
-    if not analysis_files:
+    latest_analysis = find_latest_analysis()
+    if latest_analysis is None:
         print("❌ No Sacred Geometry analysis file found!")
         print("💡 Run 'python sacred_geometry_analyzer.py' first")
         return
 
-    # Use most recent analysis
-    latest_analysis = max(analysis_files, key=lambda f: f.stat().st_mtime)
     print(f"📊 Using analysis: {latest_analysis}")
 
     # Generate optimization plan
-    optimizer = SacredGeometryOptimizer(str(latest_analysis))
+    optimizer = SacredGeometryOptimizer(latest_analysis)
     roadmap = optimizer.generate_optimization_plan()
 
     # Save plan